@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Shared disk cache for OpenBB options chain fetches.
+
+Chains are persisted as parquet under ``.cache/options_data/{symbol}/{date}/``
+so repeated runs (or multiple scripts analyzing the same symbol) skip the
+network entirely while the data is still fresh.
+"""
+import functools
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+CACHE_ROOT = Path('.cache/options_data')
+
+@functools.cache
+def get_obb():
+    """Import OpenBB once per process; the import registers every provider
+    and is expensive, so repeated calls reuse the configured instance."""
+    from openbb import obb
+    obb.user.preferences.output_type = "dataframe"
+    return obb
+
+def _ttl_seconds() -> int:
+    """TTL for cached chains: 15 min intraday, 4 h on weekends.
+
+    The cache is keyed by today's date, so entries from earlier trading
+    days are simply never looked up again — no historical TTL is needed.
+    """
+    if datetime.now().weekday() >= 5:
+        return 4 * 3600
+    return 15 * 60
+
+# float32 is ample for the 1-decimal stats computed downstream, and halving
+# column width halves the memory bandwidth every mask and mean pays for
+_ANALYSIS_DTYPES = {
+    'implied_volatility': 'float32', 'strike': 'float32', 'delta': 'float32',
+    'gamma': 'float32', 'theta': 'float32', 'vega': 'float32',
+    'bid': 'float32', 'ask': 'float32', 'dte': 'int32',
+}
+
+def _downcast(chains):
+    """Downcast the analysis columns to 4-byte dtypes where possible."""
+    for col, dtype in _ANALYSIS_DTYPES.items():
+        if col in chains.columns:
+            try:
+                chains[col] = chains[col].astype(dtype)
+            except (ValueError, TypeError):
+                pass  # e.g. NaNs in dte cannot become int32
+    # Low-cardinality string columns become integer category codes, turning
+    # every downstream equality mask into an int compare instead of
+    # per-row string comparison
+    for col in ('option_type', 'expiration'):
+        if col in chains.columns:
+            chains[col] = chains[col].astype('category')
+    return chains
+
+def fetch_chains(symbol: str, provider: str):
+    """Fetch an options chain as a DataFrame, reading the disk cache when fresh.
+
+    Repeated in-process calls for the same symbol/provider on the same day
+    (e.g. running several analyses back-to-back in a notebook) are served
+    from an in-memory LRU cache without touching disk or the network.
+    """
+    return _fetch_chains_cached(symbol, provider, date.today().isoformat())
+
+@functools.lru_cache(maxsize=32)
+def _fetch_chains_cached(symbol: str, provider: str, cache_date: str):
+    import pandas as pd
+
+    path = CACHE_ROOT / symbol / cache_date / f'{provider}_chains.parquet'
+    if path.exists() and time.time() - path.stat().st_mtime < _ttl_seconds():
+        return _downcast(pd.read_parquet(path))
+
+    result = get_obb().derivatives.options.chains(symbol, provider=provider)
+    chains = result.to_df() if hasattr(result, 'to_df') else result
+
+    if chains is not None and not chains.empty:
+        chains = _downcast(chains)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        chains.to_parquet(path, compression='snappy')
+
+    return chains
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Vectorized Black-Scholes implied volatility solver.
+
+Processes whole option chains as NumPy arrays in one pass instead of
+solving strike-by-strike in Python.
+"""
+import math
+
+import numpy as np
+from scipy.special import ndtr
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+SQRT_2PI = np.sqrt(2.0 * np.pi)
+SQRT_2 = np.sqrt(2.0)
+
+def bs_price_vega_vec(S, K, tau, r, sigma, is_call):
+    """Black-Scholes price and vega over arrays, sharing the d1/d2 terms."""
+    sqrt_tau = np.sqrt(tau)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    disc_k = K * np.exp(-r * tau)
+    call = S * ndtr(d1) - disc_k * ndtr(d2)
+    price = np.where(is_call, call, call - S + disc_k)  # put-call parity
+    vega = S * sqrt_tau * np.exp(-0.5 * d1 * d1) / SQRT_2PI
+    return price, vega
+
+def bs_all_greeks_vec(S, K, tau, r, sigma, is_call):
+    """Compute price and all Greeks over arrays in a single pass.
+
+    d1, d2, the normal CDFs, and the normal PDF are evaluated once and
+    every output is derived from them, instead of recomputing the
+    transcendentals per Greek. Theta and rho are annualized.
+    Returns a dict of arrays keyed price/delta/gamma/theta/vega/rho.
+    """
+    S, K, tau, r, sigma, is_call = np.broadcast_arrays(
+        np.asarray(S, dtype=float), np.asarray(K, dtype=float),
+        np.asarray(tau, dtype=float), np.asarray(r, dtype=float),
+        np.asarray(sigma, dtype=float), np.asarray(is_call, dtype=bool))
+
+    sqrt_tau = np.sqrt(tau)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * tau) / (sigma * sqrt_tau)
+    d2 = d1 - sigma * sqrt_tau
+    nd1_cdf = ndtr(d1)
+    nd2_cdf = ndtr(d2)
+    nd1_pdf = np.exp(-0.5 * d1 * d1) / SQRT_2PI
+    disc_k = K * np.exp(-r * tau)
+
+    call_price = S * nd1_cdf - disc_k * nd2_cdf
+    price = np.where(is_call, call_price, call_price - S + disc_k)
+    delta = np.where(is_call, nd1_cdf, nd1_cdf - 1.0)
+    gamma = nd1_pdf / (S * sigma * sqrt_tau)
+    vega = S * sqrt_tau * nd1_pdf
+    decay = -S * nd1_pdf * sigma / (2.0 * sqrt_tau)
+    theta = np.where(is_call,
+                     decay - r * disc_k * nd2_cdf,
+                     decay + r * disc_k * (1.0 - nd2_cdf))
+    rho = np.where(is_call,
+                   K * tau * np.exp(-r * tau) * nd2_cdf,
+                   -K * tau * np.exp(-r * tau) * (1.0 - nd2_cdf))
+
+    return {'price': price, 'delta': delta, 'gamma': gamma,
+            'theta': theta, 'vega': vega, 'rho': rho}
+
+def implied_vol_bs_vec(prices, S, K, tau, r, is_call, max_iter=100, tol=1e-10):
+    """Solve implied vol for a whole chain with Newton + bisection fallback.
+
+    All arguments broadcast as NumPy arrays; returns an array of vols with
+    NaN where the quote is outside no-arbitrage bounds or no root was found.
+    Uses a parallel Numba kernel when numba is installed, with a pure-NumPy
+    path otherwise.
+    """
+    prices = np.asarray(prices, dtype=float)
+    S, K, tau, r, is_call = np.broadcast_arrays(
+        np.asarray(S, dtype=float), np.asarray(K, dtype=float),
+        np.asarray(tau, dtype=float), np.asarray(r, dtype=float),
+        np.asarray(is_call, dtype=bool))
+
+    if njit is not None:
+        return _implied_vol_kernel(
+            np.ascontiguousarray(prices.ravel()), np.ascontiguousarray(S.ravel(), dtype=float),
+            np.ascontiguousarray(K.ravel(), dtype=float), np.ascontiguousarray(tau.ravel(), dtype=float),
+            np.ascontiguousarray(r.ravel(), dtype=float), np.ascontiguousarray(is_call.ravel()),
+            max_iter, tol).reshape(prices.shape)
+
+    lo = np.full(prices.shape, 1e-4)
+    hi = np.full(prices.shape, 5.0)
+    sigma = np.full(prices.shape, 0.5)
+
+    # Quotes below intrinsic value (or non-positive) have no solution
+    disc_k = K * np.exp(-r * tau)
+    intrinsic = np.where(is_call, np.maximum(S - disc_k, 0), np.maximum(disc_k - S, 0))
+    solvable = (prices > intrinsic) & (tau > 0)
+
+    converged = ~solvable
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for _ in range(max_iter):
+            price, vega = bs_price_vega_vec(S, K, tau, r, sigma, is_call)
+            diff = price - prices
+            converged = converged | (np.abs(diff) < tol)
+            if converged.all():
+                break
+            # Tighten the bracket, then try a Newton step; fall back to
+            # bisection where the step escapes the bracket or vega vanishes
+            hi = np.where(~converged & (diff > 0), sigma, hi)
+            lo = np.where(~converged & (diff < 0), sigma, lo)
+            newton = sigma - diff / vega
+            bad = ~np.isfinite(newton) | (newton <= lo) | (newton >= hi)
+            sigma = np.where(converged, sigma, np.where(bad, 0.5 * (lo + hi), newton))
+
+    return np.where(solvable & converged, sigma, np.nan)
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _implied_vol_kernel(prices, S, K, tau, r, is_call, max_iter, tol):
+        """Per-strike Newton loops compiled with Numba; strikes are
+        independent, so prange runs one scalar solve per thread without the
+        NumPy path's per-iteration temporaries."""
+        n = prices.shape[0]
+        out = np.empty(n)
+        for i in prange(n):
+            p, s, k, t, rate = prices[i], S[i], K[i], tau[i], r[i]
+            disc_k = k * math.exp(-rate * t)
+            intrinsic = max(s - disc_k, 0.0) if is_call[i] else max(disc_k - s, 0.0)
+            if not (p > intrinsic and t > 0.0):
+                out[i] = np.nan
+                continue
+
+            lo, hi, sigma = 1e-4, 5.0, 0.5
+            sqrt_t = math.sqrt(t)
+            result = np.nan
+            for _ in range(max_iter):
+                d1 = (math.log(s / k) + (rate + 0.5 * sigma * sigma) * t) / (sigma * sqrt_t)
+                d2 = d1 - sigma * sqrt_t
+                nd1 = 0.5 * (1.0 + math.erf(d1 / SQRT_2))
+                nd2 = 0.5 * (1.0 + math.erf(d2 / SQRT_2))
+                price = s * nd1 - disc_k * nd2
+                if not is_call[i]:
+                    price += disc_k - s  # put-call parity
+                diff = price - p
+                if abs(diff) < tol:
+                    result = sigma
+                    break
+                if diff > 0.0:
+                    hi = sigma
+                else:
+                    lo = sigma
+                vega = s * sqrt_t * math.exp(-0.5 * d1 * d1) / SQRT_2PI
+                newton = sigma - diff / vega if vega > 0.0 else -1.0
+                if newton <= lo or newton >= hi or not math.isfinite(newton):
+                    sigma = 0.5 * (lo + hi)
+                else:
+                    sigma = newton
+            out[i] = result
+        return out
@@ -4,13 +4,11 @@ import argparse
 
 def analyze_iv_surface(symbol: str, provider: str = 'cboe', plot: bool = True):
     """Analyze and optionally plot IV surface."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    from _chain_cache import fetch_chains
 
     print(f"\nFetching options chain for {symbol}...")
     try:
-        result = obb.derivatives.options.chains(symbol, provider=provider)
-        chains = result.to_df() if hasattr(result, 'to_df') else result
+        chains = fetch_chains(symbol, provider)
     except Exception as e:
         print(f"Error fetching options chain: {e}")
         return
@@ -19,68 +17,97 @@ def analyze_iv_surface(symbol: str, provider: str = 'cboe', plot: bool = True):
         print(f"No options data for {symbol}")
         return
 
-    price = chains['underlying_price'].iloc[0]
+    price = chains['underlying_price'].iat[0]
 
-    # Filter valid data
-    valid = chains[
-        (chains['dte'] >= 7) &
-        (chains['dte'] <= 180) &
-        (chains['implied_volatility'].notna()) &
-        (chains['implied_volatility'] > 0)
-    ]
+    # Filter valid data; query fuses the conditions into one vectorized pass
+    # (numexpr when installed) instead of allocating a mask per condition.
+    # NaN IVs fail the > 0 comparison, so no separate notna check is needed.
+    valid = chains.query('dte >= 7 and dte <= 180 and implied_volatility > 0')
 
     if valid.empty:
         print("No valid IV data found")
         return
 
-    # Analyze by expiration
-    expirations = sorted(valid['expiration'].unique())
+    import numpy as np
 
     print(f"\nUnderlying: ${price:.2f}")
     print(f"\n{'='*70}")
     print("IV SUMMARY BY EXPIRATION")
     print(f"{'='*70}")
-    print(f"{'Expiration':<12} {'DTE':>6} {'ATM IV':>10} {'Call IV':>10} {'Put IV':>10}")
-    print("-" * 70)
 
-    iv_data = []
-    for exp in expirations[:8]:  # Limit to 8 expirations
-        exp_data = valid[valid['expiration'] == exp]
-        dte = exp_data['dte'].iloc[0]
+    from concurrent.futures import ThreadPoolExecutor
+
+    # NaN-mask the IV columns once (single O(N) pass), then let a thread
+    # pool reduce the per-expiration groups: the means release the GIL, so
+    # deep chains with many expirations scale across cores
+    valid = valid.copy()
+    iv = valid['implied_volatility']
+    is_atm = valid['strike'].between(price * 0.98, price * 1.02)
+    is_call = valid['option_type'] == 'call'
+    valid['atm_iv'] = np.where(is_atm, iv, np.nan)
+    valid['call_iv'] = np.where(is_call, iv, np.nan)
+    valid['put_iv'] = np.where(~is_call, iv, np.nan)
+
+    def _compute_exp_row(item):
+        exp, g = item
+        row = {'expiration': exp, 'dte': int(g['dte'].iat[0])}
+        for col in ('atm_iv', 'call_iv', 'put_iv'):
+            mean = g[col].mean()
+            row[col] = 0 if np.isnan(mean) else mean * 100
+        return row
+
+    groups = list(valid.groupby('expiration', sort=True, observed=True))[:8]  # Limit to 8 expirations
+    with ThreadPoolExecutor() as ex:
+        iv_data = list(ex.map(_compute_exp_row, groups))
+
+    # Format the whole table in one to_string pass instead of a Python
+    # f-string per row
+    import pandas as pd
+
+    summary = pd.DataFrame(iv_data)
+    fmt_pct = '{:.1f}%'.format
+    print(summary.to_string(index=False, formatters={
+        'atm_iv': fmt_pct, 'call_iv': fmt_pct, 'put_iv': fmt_pct}))
+
+    # IV Skew analysis, computed column-wise
+    summary['skew'] = summary['put_iv'] - summary['call_iv']
+    summary['direction'] = np.select([summary['skew'] > 2, summary['skew'] < -2],
+                                     ['↑ Bearish', '↓ Bullish'], '→ Neutral')
 
-        # ATM options
-        atm = exp_data[(exp_data['strike'] >= price * 0.98) &
-                       (exp_data['strike'] <= price * 1.02)]
-
-        calls = exp_data[exp_data['option_type'] == 'call']
-        puts = exp_data[exp_data['option_type'] == 'put']
-
-        atm_iv = atm['implied_volatility'].mean() * 100 if not atm.empty else 0
-        call_iv = calls['implied_volatility'].mean() * 100 if not calls.empty else 0
-        put_iv = puts['implied_volatility'].mean() * 100 if not puts.empty else 0
-
-        print(f"{str(exp):<12} {dte:>6} {atm_iv:>9.1f}% {call_iv:>9.1f}% {put_iv:>9.1f}%")
-
-        iv_data.append({
-            'expiration': exp,
-            'dte': dte,
-            'atm_iv': atm_iv,
-            'call_iv': call_iv,
-            'put_iv': put_iv
-        })
-
-    # IV Skew analysis
     print(f"\n{'='*70}")
     print("IV SKEW (Put IV - Call IV)")
     print(f"{'='*70}")
-    for d in iv_data:
-        skew = d['put_iv'] - d['call_iv']
-        direction = "↑ Bearish" if skew > 2 else "↓ Bullish" if skew < -2 else "→ Neutral"
-        print(f"{str(d['expiration']):<12} Skew: {skew:+.1f}% {direction}")
+    print(summary[['expiration', 'skew', 'direction']].to_string(
+        index=False, formatters={'skew': '{:+.1f}%'.format}))
 
     if plot:
         plot_iv_surface(valid, price, symbol)
 
+def analyze_iv_surface_multi(symbols: list[str], provider: str = 'cboe',
+                             plot: bool = False, max_workers: int = 10):
+    """Analyze IV surfaces for several symbols, fetching chains in parallel.
+
+    The fetches are I/O-bound network calls, so a thread pool warms the disk
+    cache for all symbols concurrently; the CPU-side analysis then runs
+    sequentially on cached data.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from _chain_cache import fetch_chains
+
+    symbols = symbols[:50]  # Keep request fan-out bounded
+
+    def _prefetch(sym):
+        try:
+            fetch_chains(sym, provider)
+        except Exception:
+            pass  # Surfaced with a proper message during the per-symbol run
+
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(_prefetch, symbols))
+
+    for sym in symbols:
+        analyze_iv_surface(sym, provider, plot)
+
 def plot_iv_surface(data, price, symbol):
     """Plot 3D IV surface."""
     try:
@@ -98,6 +125,11 @@ def plot_iv_surface(data, price, symbol):
         print("Not enough data for surface plot")
         return
 
+    try:
+        from scipy.interpolate import griddata
+    except ImportError:
+        griddata = None
+
     fig = plt.figure(figsize=(12, 8))
     ax = fig.add_subplot(111, projection='3d')
 
@@ -105,7 +137,17 @@ def plot_iv_surface(data, price, symbol):
     dtes = calls['dte'].values
     ivs = calls['implied_volatility'].values * 100
 
-    ax.scatter(strikes, dtes, ivs, c=ivs, cmap='viridis', alpha=0.6)
+    if griddata is not None:
+        # Interpolate onto a regular grid: a single surface mesh renders far
+        # faster than one scatter artist per contract
+        grid_k, grid_t = np.meshgrid(
+            np.linspace(strikes.min(), strikes.max(), 50),
+            np.linspace(dtes.min(), dtes.max(), 50))
+        grid_iv = griddata((strikes, dtes), ivs, (grid_k, grid_t), method='linear')
+        ax.plot_surface(grid_k, grid_t, grid_iv, cmap='viridis',
+                        linewidth=0, antialiased=True)
+    else:
+        ax.scatter(strikes, dtes, ivs, c=ivs, cmap='viridis', alpha=0.6)
     ax.set_xlabel('Strike')
     ax.set_ylabel('DTE')
     ax.set_zlabel('IV (%)')
@@ -116,10 +158,13 @@ def plot_iv_surface(data, price, symbol):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Analyze IV surface")
-    parser.add_argument('symbol', help='Stock symbol (e.g., SPY, AAPL)')
+    parser.add_argument('symbols', nargs='+', help='Stock symbol(s) (e.g., SPY, AAPL)')
     parser.add_argument('--provider', default='cboe', choices=['cboe', 'yfinance', 'deribit'],
                         help='Data provider (default: cboe)')
     parser.add_argument('--no-plot', action='store_true', help='Skip visualization')
 
     args = parser.parse_args()
-    analyze_iv_surface(args.symbol, args.provider, not args.no_plot)
+    if len(args.symbols) > 1:
+        analyze_iv_surface_multi(args.symbols, args.provider, not args.no_plot)
+    else:
+        analyze_iv_surface(args.symbols[0], args.provider, not args.no_plot)
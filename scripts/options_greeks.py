@@ -6,13 +6,11 @@ def analyze_options_greeks(symbol: str, provider: str = 'cboe',
                            min_dte: int = 7, max_dte: int = 60,
                            pct_range: float = 0.05, visualize: bool = False):
     """Analyze options Greeks for a given symbol."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    from _chain_cache import fetch_chains
 
     print(f"\nFetching options chain for {symbol}...")
     try:
-        result = obb.derivatives.options.chains(symbol, provider=provider)
-        chains = result.to_df() if hasattr(result, 'to_df') else result
+        chains = fetch_chains(symbol, provider)
     except Exception as e:
         print(f"Error fetching options chain: {e}")
         return
@@ -26,17 +24,24 @@ def analyze_options_greeks(symbol: str, provider: str = 'cboe',
     if price_col not in chains.columns:
         print("Cannot determine underlying price from data")
         return
-    price = chains[price_col].iloc[0]
+    price = chains[price_col].iat[0]
     print(f"Underlying Price: ${price:.2f}")
 
-    # Filter valid Greeks
-    valid = chains[
-        (chains['dte'] >= min_dte) &
-        (chains['dte'] <= max_dte) &
-        (chains['delta'] != 0) &
-        (chains['delta'] != 1) &
-        (chains['delta'] != -1)
-    ]
+    # Providers without Greeks: derive them from IV in one vectorized pass
+    if 'delta' not in chains.columns and 'implied_volatility' in chains.columns:
+        from _vec_iv import bs_all_greeks_vec
+        greeks = bs_all_greeks_vec(
+            price, chains['strike'].to_numpy(),
+            chains['dte'].to_numpy() / 365.0, 0.0,
+            chains['implied_volatility'].to_numpy(),
+            (chains['option_type'] == 'call').to_numpy())
+        chains = chains.assign(delta=greeks['delta'], gamma=greeks['gamma'],
+                               theta=greeks['theta'] / 365.0,  # per-day, as providers report
+                               vega=greeks['vega'] / 100.0)    # per vol point
+
+    # Filter valid Greeks; query fuses all five conditions into one pass
+    valid = chains.query('dte >= @min_dte and dte <= @max_dte and '
+                         'delta != 0 and delta != 1 and delta != -1')
 
     if valid.empty:
         print("No valid options found with Greeks data")
@@ -50,19 +55,19 @@ def analyze_options_greeks(symbol: str, provider: str = 'cboe',
     expiry = expirations[0]
     selected = valid[valid['expiration'] == expiry]
 
-    print(f"Expiration: {expiry} (DTE: {selected['dte'].iloc[0]})")
+    print(f"Expiration: {expiry} (DTE: {selected['dte'].iat[0]})")
     print(f"Total contracts: {len(selected)}")
 
     # ATM filter
     lower = price * (1 - pct_range)
     upper = price * (1 + pct_range)
 
-    calls = selected[(selected['option_type'] == 'call') &
-                     (selected['strike'] >= lower) &
-                     (selected['strike'] <= upper)]
-    puts = selected[(selected['option_type'] == 'put') &
-                    (selected['strike'] >= lower) &
-                    (selected['strike'] <= upper)]
+    # Split by option_type in one pass instead of scanning it per side
+    in_range = selected[selected['strike'].between(lower, upper)]
+    by_type = {t: g for t, g in in_range.groupby('option_type', sort=False, observed=True)}
+    empty = in_range.iloc[0:0]
+    calls = by_type.get('call', empty)
+    puts = by_type.get('put', empty)
 
     cols = ['strike', 'delta', 'gamma', 'theta', 'vega', 'implied_volatility', 'bid', 'ask']
     available = [c for c in cols if c in calls.columns]
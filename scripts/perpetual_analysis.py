@@ -5,12 +5,11 @@ import sys
 
 def analyze_perpetuals(symbols: list[str], show_all: bool = False):
     """Analyze crypto perpetual contracts."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    from _chain_cache import get_obb
 
     symbol_str = ','.join(symbols)
     try:
-        result = obb.derivatives.futures.info(provider='deribit', symbol=symbol_str)
+        result = get_obb().derivatives.futures.info(provider='deribit', symbol=symbol_str)
         info = result.to_df() if hasattr(result, 'to_df') else result
     except Exception as e:
         print(f"Error fetching data for {symbol_str}: {e}")
@@ -28,21 +27,22 @@ def analyze_perpetuals(symbols: list[str], show_all: bool = False):
     print("CRYPTO PERPETUAL ANALYSIS")
     print(f"{'='*60}\n")
 
-    for _, row in info.iterrows():
-        sym = row.get('symbol', 'N/A')
-        print(f"Symbol: {sym}")
-        print(f"  Last Price:    ${row.get('last_price') or 0:,.2f}")
-        print(f"  Mark Price:    ${row.get('mark_price') or 0:,.2f}")
-
-        funding = row.get('current_funding') or 0
-        funding_8h = row.get('funding_8h') or 0
-        print(f"  Funding Rate:  {funding*100:.4f}% (8h: {funding_8h*100:.4f}%)")
+    # Pull each column out as a numpy array once instead of iterrows(),
+    # which boxes every cell into a Python scalar via row.get()
+    def col(name, default=None):
+        return info[name].to_numpy() if name in info.columns else [default] * len(info)
 
-        oi = row.get('open_interest') or 0
-        vol = row.get('volume_usd') or 0
-        print(f"  Open Interest: ${oi:,.0f}")
-        print(f"  24h Volume:    ${vol:,.0f}")
-        print(f"  24h Change:    {row.get('change_percent') or 0:.2f}%")
+    for sym, last, mark, funding, funding_8h, oi, vol, chg in zip(
+            col('symbol', 'N/A'), col('last_price'), col('mark_price'),
+            col('current_funding'), col('funding_8h'),
+            col('open_interest'), col('volume_usd'), col('change_percent')):
+        print(f"Symbol: {sym}")
+        print(f"  Last Price:    ${last or 0:,.2f}")
+        print(f"  Mark Price:    ${mark or 0:,.2f}")
+        print(f"  Funding Rate:  {(funding or 0)*100:.4f}% (8h: {(funding_8h or 0)*100:.4f}%)")
+        print(f"  Open Interest: ${oi or 0:,.0f}")
+        print(f"  24h Volume:    ${vol or 0:,.0f}")
+        print(f"  24h Change:    {chg or 0:.2f}%")
         print()
 
     if show_all:
@@ -51,11 +51,10 @@ def analyze_perpetuals(symbols: list[str], show_all: bool = False):
 
 def list_instruments():
     """List all available perpetual instruments."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    from _chain_cache import get_obb
 
     try:
-        result = obb.derivatives.futures.instruments(provider='deribit')
+        result = get_obb().derivatives.futures.instruments(provider='deribit')
         instruments = result.to_df() if hasattr(result, 'to_df') else result
     except Exception as e:
         print(f"Error fetching instruments: {e}")
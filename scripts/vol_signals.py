@@ -7,16 +7,14 @@ import argparse
 
 def analyze_vol_signals(symbol: str, provider: str = 'deribit'):
     """Analyze volatility trading signals for a symbol."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    from _chain_cache import fetch_chains
 
     print(f"\n{'='*60}")
     print(f"VOLATILITY SIGNALS: {symbol}")
     print(f"{'='*60}")
 
     try:
-        result = obb.derivatives.options.chains(symbol, provider=provider)
-        chains = result.to_df() if hasattr(result, 'to_df') else result
+        chains = fetch_chains(symbol, provider)
     except Exception as e:
         print(f"Error fetching data: {e}")
         return
@@ -30,25 +28,63 @@ def analyze_vol_signals(symbol: str, provider: str = 'deribit'):
     if price_col not in chains.columns:
         print("Cannot determine underlying price")
         return
-    price = chains[price_col].iloc[0]
-
-    # Filter valid options
-    valid = chains[
-        (chains['dte'] >= 1) &
-        (chains['implied_volatility'].notna()) &
-        (chains['implied_volatility'] > 0)
-    ]
+    price = chains[price_col].iat[0]
+
+    # Backfill IVs the provider left missing by solving the whole chain's
+    # mid quotes in one vectorized Newton pass
+    if {'bid', 'ask'}.issubset(chains.columns) and chains['implied_volatility'].isna().any():
+        from _vec_iv import implied_vol_bs_vec
+        mids = (chains['bid'] + chains['ask']) / 2
+        need = chains['implied_volatility'].isna() & (mids > 0) & (chains['dte'] > 0)
+        if need.any():
+            sub = chains.loc[need]
+            solved = implied_vol_bs_vec(
+                mids[need].to_numpy(), price, sub['strike'].to_numpy(),
+                sub['dte'].to_numpy() / 365.0, 0.0,
+                (sub['option_type'] == 'call').to_numpy())
+            iv_filled = chains['implied_volatility'].copy()
+            iv_filled[need] = solved.astype(iv_filled.dtype)  # solver returns float64; column is float32
+            chains = chains.assign(implied_volatility=iv_filled)
+
+    # Filter valid options in one fused query pass (NaN IVs fail the > 0 check)
+    valid = chains.query('dte >= 1 and implied_volatility > 0')
 
     if valid.empty:
         print("No valid options data")
         return
 
+    import numpy as np
+
     # Get expirations
     expirations = sorted(valid['dte'].unique())
 
     print(f"\nUnderlying: ${price:,.2f}")
     print(f"Expirations (DTE): {expirations[:8]}")
 
+    # Sort once by (dte, strike) and extract the hot columns as contiguous
+    # NumPy arrays (SoA). Each DTE then occupies a contiguous block whose
+    # strikes are ordered, so every ATM/OTM band reduces to a pair of binary
+    # searches instead of a full-array mask scan
+    valid = valid.sort_values(['dte', 'strike'], kind='mergesort')
+    strikes = valid['strike'].to_numpy()
+    dtes = valid['dte'].to_numpy()
+    ivs = valid['implied_volatility'].to_numpy()
+    is_call = (valid['option_type'] == 'call').to_numpy()
+    bids = valid['bid'].to_numpy()
+    asks = valid['ask'].to_numpy()
+    thetas = valid['theta'].to_numpy() if 'theta' in valid.columns else None
+    strike_dist = np.abs(strikes - price)
+
+    def dte_block(dte):
+        return np.searchsorted(dtes, dte, side='left'), np.searchsorted(dtes, dte, side='right')
+
+    def band_iv(lo, hi, k_lo, k_hi, side=None):
+        """Mean IV for strikes in [k_lo, k_hi] within a DTE block."""
+        a = lo + np.searchsorted(strikes[lo:hi], k_lo, side='left')
+        b = lo + np.searchsorted(strikes[lo:hi], k_hi, side='right')
+        sel = ivs[a:b] if side is None else ivs[a:b][is_call[a:b] == side]
+        return sel.mean() * 100 if sel.size else 0.0
+
     # 1. Term Structure Analysis
     print(f"\n{'─'*60}")
     print("TERM STRUCTURE")
@@ -56,11 +92,9 @@ def analyze_vol_signals(symbol: str, provider: str = 'deribit'):
 
     ts_data = []
     for dte in expirations[:6]:
-        exp_data = valid[valid['dte'] == dte]
-        atm = exp_data[(exp_data['strike'] >= price * 0.98) &
-                       (exp_data['strike'] <= price * 1.02)]
-        if not atm.empty:
-            atm_iv = atm['implied_volatility'].mean() * 100
+        lo, hi = dte_block(dte)
+        atm_iv = band_iv(lo, hi, price * 0.98, price * 1.02)
+        if atm_iv > 0:
             ts_data.append({'dte': dte, 'atm_iv': atm_iv})
             print(f"  DTE {dte:3d}: ATM IV = {atm_iv:.1f}%")
 
@@ -73,83 +107,53 @@ def analyze_vol_signals(symbol: str, provider: str = 'deribit'):
         if structure == "CONTANGO":
             print("  Signal: Calendar spread opportunity (+Theta, +Gamma)")
 
-    # 2. Fly Analysis (Vol-of-Vol proxy)
-    print(f"\n{'─'*60}")
-    print("FLY ANALYSIS (Vol-of-Vol)")
-    print(f"{'─'*60}")
+    # 2-4. Fly, Skew, and Straddle share the same near-dated slices, so
+    # compute all three analyses from the cached arrays in one per-DTE loop
+    near = expirations[:3]
 
-    for dte in expirations[:3]:
-        exp_data = valid[valid['dte'] == dte]
-        calls = exp_data[exp_data['option_type'] == 'call']
-        puts = exp_data[exp_data['option_type'] == 'put']
-
-        # ATM IV
-        atm_calls = calls[(calls['strike'] >= price * 0.98) &
-                          (calls['strike'] <= price * 1.02)]
-        atm_iv = atm_calls['implied_volatility'].mean() * 100 if not atm_calls.empty else 0
-
-        # 25 Delta wings (approximate with 5% OTM)
-        otm_calls = calls[(calls['strike'] >= price * 1.03) &
-                          (calls['strike'] <= price * 1.08)]
-        otm_puts = puts[(puts['strike'] >= price * 0.92) &
-                        (puts['strike'] <= price * 0.97)]
-
-        call_25d_iv = otm_calls['implied_volatility'].mean() * 100 if not otm_calls.empty else 0
-        put_25d_iv = otm_puts['implied_volatility'].mean() * 100 if not otm_puts.empty else 0
+    fly_lines, skew_lines, straddle_lines = [], [], []
+    for dte in near:
+        lo, hi = dte_block(dte)
+        atm_iv = band_iv(lo, hi, price * 0.98, price * 1.02, side=True)
+        call_25d_iv = band_iv(lo, hi, price * 1.03, price * 1.08, side=True)
+        put_25d_iv = band_iv(lo, hi, price * 0.92, price * 0.97, side=False)
 
+        # Fly (ATM vs 25 Delta wings, approximated with 5% OTM)
         if atm_iv > 0 and call_25d_iv > 0 and put_25d_iv > 0:
             fly = (call_25d_iv + put_25d_iv) / 2 - atm_iv
-            print(f"  DTE {dte:3d}: Fly = {fly:+.2f}% (ATM={atm_iv:.1f}%, Wings avg={((call_25d_iv+put_25d_iv)/2):.1f}%)")
-
-    # 3. Skew Analysis
-    print(f"\n{'─'*60}")
-    print("SKEW ANALYSIS")
-    print(f"{'─'*60}")
-
-    for dte in expirations[:3]:
-        exp_data = valid[valid['dte'] == dte]
-        calls = exp_data[exp_data['option_type'] == 'call']
-        puts = exp_data[exp_data['option_type'] == 'put']
-
-        otm_calls = calls[(calls['strike'] >= price * 1.03) &
-                          (calls['strike'] <= price * 1.08)]
-        otm_puts = puts[(puts['strike'] >= price * 0.92) &
-                        (puts['strike'] <= price * 0.97)]
-
-        call_iv = otm_calls['implied_volatility'].mean() * 100 if not otm_calls.empty else 0
-        put_iv = otm_puts['implied_volatility'].mean() * 100 if not otm_puts.empty else 0
+            fly_lines.append(f"  DTE {dte:3d}: Fly = {fly:+.2f}% (ATM={atm_iv:.1f}%, Wings avg={((call_25d_iv+put_25d_iv)/2):.1f}%)")
 
-        if call_iv > 0 and put_iv > 0:
-            skew = put_iv - call_iv
+        # Skew
+        if call_25d_iv > 0 and put_25d_iv > 0:
+            skew = put_25d_iv - call_25d_iv
             direction = "BEARISH" if skew > 2 else "BULLISH" if skew < -2 else "NEUTRAL"
-            print(f"  DTE {dte:3d}: Skew = {skew:+.2f}% ({direction})")
+            skew_lines.append(f"  DTE {dte:3d}: Skew = {skew:+.2f}% ({direction})")
 
-    # 4. Straddle Premium
-    print(f"\n{'─'*60}")
-    print("ATM STRADDLE ANALYSIS")
-    print(f"{'─'*60}")
+        # Straddle: pick the closest strike per side within the DTE block
+        call_idx = lo + np.flatnonzero(is_call[lo:hi])
+        put_idx = lo + np.flatnonzero(~is_call[lo:hi])
 
-    for dte in expirations[:3]:
-        exp_data = valid[valid['dte'] == dte]
-        atm_strike = round(price / 5) * 5  # Round to nearest 5
+        if call_idx.size and put_idx.size:
+            ci = call_idx[strike_dist[call_idx].argmin()]
+            pi = put_idx[strike_dist[put_idx].argmin()]
 
-        atm_call = exp_data[(exp_data['option_type'] == 'call') &
-                            (abs(exp_data['strike'] - price) == abs(exp_data['strike'] - price).min())]
-        atm_put = exp_data[(exp_data['option_type'] == 'put') &
-                           (abs(exp_data['strike'] - price) == abs(exp_data['strike'] - price).min())]
-
-        if not atm_call.empty and not atm_put.empty:
-            call_mid = (atm_call['bid'].iloc[0] + atm_call['ask'].iloc[0]) / 2
-            put_mid = (atm_put['bid'].iloc[0] + atm_put['ask'].iloc[0]) / 2
+            call_mid = (bids[ci] + asks[ci]) / 2
+            put_mid = (bids[pi] + asks[pi]) / 2
             straddle_cost = call_mid + put_mid
             pct_move = (straddle_cost / price) * 100
 
-            call_theta = atm_call['theta'].iloc[0] if 'theta' in atm_call.columns else 0
-            put_theta = atm_put['theta'].iloc[0] if 'theta' in atm_put.columns else 0
-            total_theta = call_theta + put_theta
+            total_theta = (thetas[ci] + thetas[pi]) if thetas is not None else 0
+
+            straddle_lines.append(f"  DTE {dte:3d}: Straddle = ${straddle_cost:.2f} ({pct_move:.2f}% move needed)")
+            straddle_lines.append(f"           Theta = ${total_theta:.2f}/day | BE Daily Move = {pct_move/dte:.3f}%")
 
-            print(f"  DTE {dte:3d}: Straddle = ${straddle_cost:.2f} ({pct_move:.2f}% move needed)")
-            print(f"           Theta = ${total_theta:.2f}/day | BE Daily Move = {pct_move/dte:.3f}%")
+    for title, lines in [("FLY ANALYSIS (Vol-of-Vol)", fly_lines),
+                         ("SKEW ANALYSIS", skew_lines),
+                         ("ATM STRADDLE ANALYSIS", straddle_lines)]:
+        print(f"\n{'─'*60}")
+        print(title)
+        print(f"{'─'*60}")
+        print("\n".join(lines))
 
     # 5. Trading Signals Summary
     print(f"\n{'='*60}")
@@ -171,8 +175,8 @@ def analyze_vol_signals(symbol: str, provider: str = 'deribit'):
 
 def calculate_vrp(symbol: str, lookback_days: int = 30):
     """Calculate Variance Risk Premium approximation."""
-    from openbb import obb
-    obb.user.preferences.output_type = "dataframe"
+    import numpy as np
+    from _chain_cache import fetch_chains, get_obb
 
     print(f"\n{'='*60}")
     print(f"VRP ANALYSIS: {symbol}")
@@ -180,8 +184,7 @@ def calculate_vrp(symbol: str, lookback_days: int = 30):
 
     try:
         # Get current IV
-        result = obb.derivatives.options.chains(symbol, provider='deribit')
-        chains = result.to_df() if hasattr(result, 'to_df') else result
+        chains = fetch_chains(symbol, 'deribit')
 
         if chains is None or chains.empty:
             print("No options data")
@@ -189,11 +192,10 @@ def calculate_vrp(symbol: str, lookback_days: int = 30):
 
         # Get 30-day ATM IV
         price_col = 'underlying_price' if 'underlying_price' in chains.columns else 'spot_price'
-        price = chains[price_col].iloc[0]
+        price = chains[price_col].iat[0]
 
-        month_options = chains[(chains['dte'] >= 25) & (chains['dte'] <= 35)]
-        atm = month_options[(month_options['strike'] >= price * 0.98) &
-                            (month_options['strike'] <= price * 1.02)]
+        atm = chains.query('dte >= 25 and dte <= 35 and '
+                           'strike >= @price * 0.98 and strike <= @price * 1.02')
 
         if atm.empty:
             print("No ATM options for 30-day expiry")
@@ -203,16 +205,17 @@ def calculate_vrp(symbol: str, lookback_days: int = 30):
         print(f"\n30-Day IV: {iv_30d:.1f}%")
 
         # Get historical prices for RV calculation
-        hist_result = obb.equity.price.historical(symbol=symbol, provider='yfinance')
+        hist_result = get_obb().equity.price.historical(symbol=symbol, provider='yfinance')
         hist = hist_result.to_df() if hasattr(hist_result, 'to_df') else hist_result
 
         if hist is None or len(hist) < lookback_days:
             print("Insufficient historical data for RV")
             return
 
-        # Calculate realized volatility
-        returns = hist['close'].pct_change().dropna().tail(lookback_days)
-        rv_30d = returns.std() * (252 ** 0.5) * 100
+        # Calculate realized volatility from log returns in one NumPy pass
+        closes = hist['close'].to_numpy()[-(lookback_days + 1):]
+        returns = np.diff(np.log(closes))
+        rv_30d = returns.std(ddof=1) * np.sqrt(252) * 100
 
         print(f"30-Day RV: {rv_30d:.1f}%")
 